@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Build assets/pci_db.marshal from a pci.ids file.
+
+There is no canonical pci.ids location across distros, so the AppImage
+ships a preprocessed copy of the database. This script parses pci.ids
+the same way thermals.py does (vendor/device lines only, subsystems
+skipped) and marshals the resulting {(vendor, device): name} dict.
+
+Usage: build_pci_db.py [path/to/pci.ids]
+"""
+import marshal
+import sys
+from pathlib import Path
+
+PCI_IDS = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("/usr/share/misc/pci.ids")
+OUT = Path(__file__).parent / "assets/pci_db.marshal"
+
+
+def parse_pci_ids(path):
+    vendor_map = {}
+    device_map = {}
+    current_vendor_id = None
+
+    for line in path.read_text(errors="ignore").splitlines():
+        if not line or line.startswith("#"):
+            continue
+
+        if not line.startswith("\t"):
+            parts = line.split(maxsplit=1)
+            if len(parts) > 1:
+                current_vendor_id = parts[0].lower()
+                vendor_map[current_vendor_id] = parts[1]
+            else:
+                current_vendor_id = None
+        elif current_vendor_id and not line.startswith("\t\t"):
+            parts = line.strip().split(maxsplit=1)
+            if len(parts) > 1:
+                name = f"{vendor_map[current_vendor_id]} {parts[1]}"
+                device_map[(current_vendor_id, parts[0].lower())] = name
+
+    return device_map
+
+
+def main():
+    if not PCI_IDS.exists():
+        sys.exit(f"{PCI_IDS}: not found")
+
+    device_map = parse_pci_ids(PCI_IDS)
+    with open(OUT, "wb") as f:
+        marshal.dump(device_map, f)
+    print(f"{OUT}: {len(device_map)} devices from {PCI_IDS}")
+
+
+if __name__ == "__main__":
+    main()
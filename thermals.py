@@ -1,10 +1,18 @@
+import marshal
+import os
+import pickle
+import select
 import sys
+import time
 from pathlib import Path
 from PySide6.QtWidgets import (
     QApplication, QTreeWidget, QTreeWidgetItem,
     QWidget, QVBoxLayout, QHeaderView, QStyle, QSplashScreen
 )
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import (
+    QMutex, QMutexLocker, QObject, QRunnable, QThread, QThreadPool,
+    QTimer, Signal
+)
 from PySide6.QtGui import QColor, QFont, QPixmap
 
 APP_NAME = "LX Thermals"
@@ -23,8 +31,10 @@ GPU_HWMONS = [
 NVME_HWMON = Path("/sys/class/hwmon/hwmon1")  # nvme
 
 PCI_IDS = Path("/usr/share/misc/pci.ids")
+PCI_CACHE = Path.home() / ".cache/lx-thermals/pci.pkl"
 
 ASSETS_DIR = Path(__file__).parent / "assets"
+PCI_DB_BLOB = ASSETS_DIR / "pci_db.marshal"  # built by build_pci_db.py
 SPLASH_IMAGE = ASSETS_DIR / "lx-thermals.png"
 APP_ICON_IMAGE = ASSETS_DIR / "lx-thermals-icon.png"
 
@@ -32,21 +42,29 @@ APP_ICON_IMAGE = ASSETS_DIR / "lx-thermals-icon.png"
 # Hardware name helpers
 # -------------------------------------------------
 def get_cpu_name():
+    # /proc/cpuinfo repeats its block per core and can run to tens of KB
+    # on big boxes; find the first "model name" with bytes searches
+    # instead of decoding and splitting every line.
     try:
-        for line in Path("/proc/cpuinfo").read_text().splitlines():
-            if line.startswith("model name"):
-                return line.split(":", 1)[1].strip()
+        with open("/proc/cpuinfo", "rb") as f:
+            data = f.read()
+        i = data.find(b"model name")
+        if i != -1:
+            j = data.find(b":", i)
+            k = data.find(b"\n", j)
+            if j != -1 and k != -1:
+                return data[j + 1:k].strip().decode()
     except Exception:
         pass
     return "Unknown CPU"
 
-def lookup_pci_name(vendor, device):
-    if not PCI_IDS.exists():
-        return None
+_device_map = {}
+_pci_db_loaded = False
 
-    vendor = vendor.lower()
-    device = device.lower()
-    current_vendor = None
+def _parse_pci_ids():
+    vendor_map = {}
+    device_map = {}
+    current_vendor_id = None
 
     for line in PCI_IDS.read_text(errors="ignore").splitlines():
         if not line or line.startswith("#"):
@@ -54,16 +72,62 @@ def lookup_pci_name(vendor, device):
 
         if not line.startswith("\t"):
             parts = line.split(maxsplit=1)
-            current_vendor = parts[1] if parts[0].lower() == vendor and len(parts) > 1 else None
-        elif current_vendor:
+            if len(parts) > 1:
+                current_vendor_id = parts[0].lower()
+                vendor_map[current_vendor_id] = parts[1]
+            else:
+                current_vendor_id = None
+        elif current_vendor_id and not line.startswith("\t\t"):
             parts = line.strip().split(maxsplit=1)
-            if parts[0].lower() == device:
-                return f"{current_vendor} {parts[1]}"
+            if len(parts) > 1:
+                name = f"{vendor_map[current_vendor_id]} {parts[1]}"
+                device_map[(current_vendor_id, parts[0].lower())] = name
+
+    return device_map
+
+def _load_pci_db():
+    global _device_map, _pci_db_loaded
+
+    if _pci_db_loaded:
+        return
+    _pci_db_loaded = True
+
+    if not PCI_IDS.exists():
+        # No system database (location is distro-dependent); fall back to
+        # the preprocessed copy bundled with the app.
+        try:
+            with open(PCI_DB_BLOB, "rb") as f:
+                _device_map = marshal.load(f)
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+        return
+
+    mtime = PCI_IDS.stat().st_mtime
+
+    try:
+        with open(PCI_CACHE, "rb") as f:
+            cached_mtime, device_map = pickle.load(f)
+        if cached_mtime == mtime:
+            _device_map = device_map
+            return
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass
+
+    _device_map = _parse_pci_ids()
+
+    try:
+        PCI_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        with open(PCI_CACHE, "wb") as f:
+            pickle.dump((mtime, _device_map), f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
 
-    return None
+def lookup_pci_name(vendor, device):
+    return _device_map.get((vendor.lower(), device.lower()))
 
 def get_gpu_name():
     try:
+        _load_pci_db()
         for card in Path("/sys/class/drm").glob("card*"):
             vendor_file = card / "device/vendor"
             device_file = card / "device/device"
@@ -84,90 +148,392 @@ def get_gpu_name():
 
     return "Unknown GPU", False
 
-CPU_NAME = get_cpu_name()
-GPU_NAME, GPU_NAME_KNOWN = get_gpu_name()
+# Name discovery parses /proc/cpuinfo and pci.ids, which is the slowest
+# part of startup; run it on the thread pool so the splash screen paints
+# immediately instead of waiting on file I/O.
+class NameWorkerSignals(QObject):
+    finished = Signal(str, str, bool)
+
+class NameWorker(QRunnable):
+    def __init__(self):
+        super().__init__()
+        self.signals = NameWorkerSignals()
+
+    def run(self):
+        cpu_name = get_cpu_name()
+        gpu_name, gpu_known = get_gpu_name()
+        self.signals.finished.emit(cpu_name, gpu_name, gpu_known)
 
 # -------------------------------------------------
 # Min / Max storage
 # -------------------------------------------------
-cpu_pkg_min = cpu_pkg_max = None
-cpu_die_min = cpu_die_max = None
-cpu_clk_min = cpu_clk_max = None
-
-gpu_temp_min = gpu_temp_max = None
-gpu_hot_min = gpu_hot_max = None
-gpu_mem_min = gpu_mem_max = None
-gpu_clk_min = gpu_clk_max = None
-gpu_memclk_min = gpu_memclk_max = None
-gpu_fan_min = gpu_fan_max = None
-
-nvme_min = nvme_max = None
+# One [cur, min, max, cur_str, min_str, max_str] row per sensor instead
+# of 18 separately tracked globals; every stat goes through the same
+# update path. The formatted strings are cached next to the values so
+# min/max — which rarely move once warmed up — are not re-formatted
+# every tick.
+STAT_KEYS = (
+    "cpu_pkg", "cpu_die", "cpu_clk",
+    "gpu_temp", "gpu_hot", "gpu_mem",
+    "gpu_clk", "gpu_memclk", "gpu_fan",
+    "nvme",
+)
+stats = {key: [None, None, None, "", "", ""] for key in STAT_KEYS}
+
+def update_stat(key, value, spec):
+    row = stats[key]
+    if value != row[0]:
+        row[0] = value
+        row[3] = format(value, spec)
+    if row[1] is None or value < row[1]:
+        row[1] = value
+        row[4] = row[3]
+    if row[2] is None or value > row[2]:
+        row[2] = value
+        row[5] = row[3]
+    return row[3], row[4], row[5]
 
 # -------------------------------------------------
 # Generic hwmon reader (temps)
 # -------------------------------------------------
-def read_hwmon(path):
-    results = {}
+# Sysfs nodes are stable once discovered, so every sensor file is opened
+# exactly once and re-read with pread(fd, n, 0) on each tick. Cached fds
+# are dropped and rediscovered if a read fails (device went away).
+def _open_ro(path):
+    try:
+        return os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return None
+
+# Single static buffer for all sensor reads: the poller is the only
+# thread touching sysfs, so every preadv lands in the same iovec and no
+# read allocates a fresh bytes object.
+_read_buf = bytearray(32)
+_read_iov = [memoryview(_read_buf)]
+
+def _read_int(fd):
+    # int() accepts the raw bytes, trailing newline included — no decode,
+    # strip or split allocations on the hot path.
+    n = os.preadv(fd, _read_iov, 0)
+    return int(_read_buf[:n])
+
+def _close_all(fds):
+    for fd in fds:
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+# hwmon input fds that may signal events via EPOLLPRI; the poller
+# registers them so a sensor event wakes it early instead of waiting out
+# the full tick.
+_event_fds = set()
+
+def _discover_hwmon(path):
+    entries = []
+
+    # One scandir gives every entry name; label/crit presence checks are
+    # then set lookups instead of a stat syscall each.
+    try:
+        names = {e.name for e in os.scandir(path)}
+    except OSError:
+        return entries
+
+    for n in sorted(names):
+        if not (n.startswith("temp") and n.endswith("_input")):
+            continue
+        idx = n[4:-6]
+
+        if f"temp{idx}_label" not in names:
+            continue
+
+        name = (path / f"temp{idx}_label").read_text().strip()
+        fd_input = _open_ro(path / n)
+        if fd_input is None:
+            continue
+        crit = f"temp{idx}_crit"
+        fd_crit = _open_ro(path / crit) if crit in names else None
+        _event_fds.add(fd_input)
+        entries.append((name, fd_input, fd_crit))
+
+    return entries
+
+def make_hwmon_reader(path):
+    """Scan a hwmon dir once and return a closure that re-reads only the
+    discovered sensor files; no glob or stat on the per-tick path."""
+    entries = _discover_hwmon(path)
+
+    def read():
+        nonlocal entries
 
-    for p in path.glob("temp*_input"):
-        idx = p.stem.replace("temp", "").replace("_input", "")
-        label = path / f"temp{idx}_label"
-        crit = path / f"temp{idx}_crit"
+        if entries is None:
+            entries = _discover_hwmon(path)
 
-        if label.exists():
-            name = label.read_text().strip()
-            value = int(p.read_text().strip()) / 1000
-            crit_val = int(crit.read_text().strip()) / 1000 if crit.exists() else None
-            results[name] = (value, crit_val)
+        results = {}
+        try:
+            for name, fd_input, fd_crit in entries:
+                value = _read_int(fd_input) / 1000
+                crit_val = _read_int(fd_crit) / 1000 if fd_crit is not None else None
+                results[name] = (value, crit_val)
+        except OSError:
+            for _, fd_input, fd_crit in entries:
+                _event_fds.discard(fd_input)
+                _close_all((fd_input, fd_crit))
+            entries = None
+            return {}
 
-    return results
+        return results
+
+    return read
 
 # -------------------------------------------------
 # Clock / fan readers
 # -------------------------------------------------
-def read_cpu_clock():
+# scaling_cur_freq can take >1 ms per read on some AMD drivers, and the
+# cost grows with core count. Time one read at startup: if it is slow,
+# fall back to the cached "cpu MHz" values in /proc/cpuinfo; otherwise
+# keep sysfs but sample only the first few cores. After a while on the
+# fallback, re-probe in case the driver has recovered.
+_CPU_FREQ_SLOW_US = 500
+_CPU_FREQ_SAMPLE_CORES = 4
+_CPU_FREQ_RETRY_TICKS = 300
+
+_cpu_freq_source = None
+_cpu_freq_fds = None
+_cpu_freq_slow_ticks = 0
+
+def _time_freq_read():
+    fd = _open_ro(Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"))
+    if fd is None:
+        return None
+
+    try:
+        start = time.perf_counter()
+        _read_int(fd)
+        return (time.perf_counter() - start) * 1_000_000  # µs
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+def _read_cpuinfo_clock():
     freqs = []
-    for cpu in Path("/sys/devices/system/cpu").glob("cpu[0-9]*"):
-        f = cpu / "cpufreq/scaling_cur_freq"
-        if f.exists():
-            freqs.append(int(f.read_text().strip()) / 1_000_000)  # GHz
+    for line in Path("/proc/cpuinfo").read_text().splitlines():
+        if line.startswith("cpu MHz"):
+            freqs.append(float(line.split(":", 1)[1]) / 1000)  # GHz
     return sum(freqs) / len(freqs) if freqs else None
 
+def read_cpu_clock():
+    global _cpu_freq_source, _cpu_freq_fds, _cpu_freq_slow_ticks
+
+    if _cpu_freq_source is None:
+        cost = _time_freq_read()
+        _cpu_freq_source = "cpuinfo" if cost is None or cost > _CPU_FREQ_SLOW_US else "sysfs"
+
+    if _cpu_freq_source == "cpuinfo":
+        _cpu_freq_slow_ticks += 1
+        if _cpu_freq_slow_ticks >= _CPU_FREQ_RETRY_TICKS:
+            _cpu_freq_slow_ticks = 0
+            _cpu_freq_source = None
+        return _read_cpuinfo_clock()
+
+    if _cpu_freq_fds is None:
+        _cpu_freq_fds = []
+        for i in range(_CPU_FREQ_SAMPLE_CORES):
+            f = Path(f"/sys/devices/system/cpu/cpu{i}/cpufreq/scaling_cur_freq")
+            if f.exists():
+                fd = _open_ro(f)
+                if fd is not None:
+                    _cpu_freq_fds.append(fd)
+
+    try:
+        freqs = [_read_int(fd) / 1_000_000 for fd in _cpu_freq_fds]  # GHz
+    except OSError:
+        _close_all(_cpu_freq_fds)
+        _cpu_freq_fds = None
+        return None
+
+    return sum(freqs) / len(freqs) if freqs else None
+
+_gpu_clock_fds = None
+
+def _discover_gpu_clocks():
+    entries = []
+
+    for h in GPU_HWMONS:
+        freq_entries = []
+        try:
+            names = {e.name for e in os.scandir(h)}
+        except OSError:
+            names = set()
+
+        for n in sorted(names):
+            if n.startswith("freq") and n.endswith("_input") and n[4:-6].isdigit():
+                fd = _open_ro(h / n)
+                if fd is not None:
+                    freq_entries.append((int(n[4:-6]), fd))
+
+        fan_fd = _open_ro(h / "fan1_input") if "fan1_input" in names else None
+        entries.append((freq_entries, fan_fd))
+
+    return entries
+
 def read_gpu_clocks_and_fan():
+    global _gpu_clock_fds
+
+    if _gpu_clock_fds is None:
+        _gpu_clock_fds = _discover_gpu_clocks()
+
     core_clocks = []
     mem_clock = None
     fan = None
 
-    for h in GPU_HWMONS:
-        for p in h.glob("freq*_input"):
-            val = int(p.read_text().strip())
-            if val > 0:
-                core_clocks.append(val / 1_000_000)  # MHz
-
-        f = h / "fan1_input"
-        if f.exists():
-            fan = int(f.read_text().strip())
-
-        m = h / "freq2_input"
-        if m.exists():
-            mem_clock = int(m.read_text().strip()) / 1_000_000  # MHz
+    try:
+        for freq_entries, fan_fd in _gpu_clock_fds:
+            # freq2 is the memory clock on amdgpu; everything else
+            # counts as a core clock. One read per fd covers both.
+            for idx, fd in freq_entries:
+                val = _read_int(fd)
+                if idx == 2:
+                    mem_clock = val / 1_000_000  # MHz
+                elif val > 0:
+                    core_clocks.append(val / 1_000_000)  # MHz
+
+            if fan_fd is not None:
+                fan = _read_int(fan_fd)
+    except OSError:
+        for freq_entries, fan_fd in _gpu_clock_fds:
+            _close_all([fd for _, fd in freq_entries] + [fan_fd])
+        _gpu_clock_fds = None
+        return None, None, None
 
     core = max(core_clocks) if core_clocks else None
     return core, mem_clock, fan
 
+# -------------------------------------------------
+# Background sensor poller
+# -------------------------------------------------
+read_cpu_hwmon = make_hwmon_reader(CPU_HWMON)
+read_gpu_hwmons = [make_hwmon_reader(path) for path in GPU_HWMONS]
+
+# Only the composite (temp1) is displayed for the NVMe drive, so read
+# that one file directly instead of sweeping every sensor the drive
+# exposes.
+_nvme_fd = None
+
+def read_nvme_temp():
+    global _nvme_fd
+
+    if _nvme_fd is None:
+        _nvme_fd = _open_ro(NVME_HWMON / "temp1_input")
+        if _nvme_fd is None:
+            return None
+        _event_fds.add(_nvme_fd)
+
+    try:
+        return _read_int(_nvme_fd) / 1000
+    except OSError:
+        _event_fds.discard(_nvme_fd)
+        _close_all((_nvme_fd,))
+        _nvme_fd = None
+        return None
+
+def collect_snapshot():
+    gpu = {}
+    for read in read_gpu_hwmons:
+        gpu.update(read())
+
+    gclk, gmemclk, gfan = read_gpu_clocks_and_fan()
+
+    return {
+        "cpu": read_cpu_hwmon(),
+        "cpu_clk": read_cpu_clock(),
+        "gpu": gpu,
+        "gpu_clk": gclk,
+        "gpu_memclk": gmemclk,
+        "gpu_fan": gfan,
+        "nvme": read_nvme_temp(),
+    }
+
+class SensorPoller(QThread):
+    """Polls hwmon/cpufreq off the GUI thread so painting never blocks on
+    sysfs reads, and so only one thread ever touches the sensor files."""
+
+    updated = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mutex = QMutex()
+        self._snapshot = {}
+
+    def snapshot(self):
+        with QMutexLocker(self._mutex):
+            return self._snapshot
+
+    def run(self):
+        # Sensors that support POLLPRI wake the sweep as soon as they
+        # signal; everything else is covered by the 1 s poll timeout, so
+        # this degrades to the plain 1 Hz tick on drivers without events.
+        epoll = select.epoll()
+        registered = set()
+
+        while not self.isInterruptionRequested():
+            snap = collect_snapshot()
+            with QMutexLocker(self._mutex):
+                self._snapshot = snap
+            self.updated.emit(snap)
+
+            for fd in _event_fds - registered:
+                try:
+                    epoll.register(fd, select.EPOLLPRI | select.EPOLLERR)
+                except OSError:
+                    pass
+                registered.add(fd)
+            registered &= _event_fds
+
+            try:
+                epoll.poll(1.0)
+            except (OSError, InterruptedError):
+                self.msleep(1000)
+
+        epoll.close()
+
 # -------------------------------------------------
 # Colour helpers
 # -------------------------------------------------
+_RED = QColor("#c0392b")
+_AMBER = QColor("#f39c12")
+_GRAY = QColor("gray")
+_DEFAULT = QColor()
+
 def temp_colour(value):
     if value >= 85:
-        return QColor("#c0392b")
+        return _RED
     if value >= 80:
-        return QColor("#f39c12")
-    return None
+        return _AMBER
+    return _DEFAULT
 
 def set_temp_colour(item, column, value):
-    colour = temp_colour(value)
-    item.setForeground(column, colour if colour else QColor())
+    item.setForeground(column, temp_colour(value))
+
+# item -> (bound setText, last strings per column). Resolving setText
+# once per item skips the attribute lookup through the shiboken wrapper
+# on every one of the ~40 cell updates per tick.
+_cell_cache = {}
+
+def set_if_changed(item, col, s):
+    """setText only when the displayed string actually changed, so Qt
+    skips model signalling and repaint scheduling for stable cells."""
+    cached = _cell_cache.get(item)
+    if cached is None:
+        cached = _cell_cache[item] = (item.setText, ["", "", "", "", ""])
+    set_text, last = cached
+    if last[col] == s:
+        return False
+    last[col] = s
+    set_text(col, s)
+    return True
 
 # -------------------------------------------------
 # UI + Splash
@@ -183,7 +549,7 @@ splash = QSplashScreen(splash_pixmap)
 splash.show()
 app.processEvents()
 
-SPLASH_MIN_MS = 5000  # 5 seconds minimum
+SPLASH_MAX_MS = 5000  # upper bound; the window shows as soon as setup finishes
 
 window = QWidget()
 window.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
@@ -209,7 +575,7 @@ layout.addWidget(tree)
 # -------------------------------------------------
 # CPU
 # -------------------------------------------------
-cpu_parent = QTreeWidgetItem(tree, [f"CPU ({CPU_NAME})"])
+cpu_parent = QTreeWidgetItem(tree, ["CPU"])
 cpu_parent.setExpanded(True)
 
 cpu_pkg_item = QTreeWidgetItem(cpu_parent, ["CPU Package"])
@@ -218,23 +584,15 @@ cpu_clk_item = QTreeWidgetItem(cpu_parent, ["CPU Clock (GHz)"])
 
 for item in (cpu_pkg_item, cpu_die_item):
     item.setText(4, "—")
-    item.setForeground(4, QColor("gray"))
+    item.setForeground(4, _GRAY)
     item.setToolTip(4, "CPU critical temperature not exposed by kernel")
 
 # -------------------------------------------------
 # GPU
 # -------------------------------------------------
-gpu_parent = QTreeWidgetItem(tree, [f"GPU ({GPU_NAME})"])
+gpu_parent = QTreeWidgetItem(tree, ["GPU"])
 gpu_parent.setExpanded(True)
 
-if not GPU_NAME_KNOWN:
-    gpu_parent.setToolTip(
-        0,
-        "GPU model name not yet available in the system PCI database.\n"
-        "This will update automatically when pci.ids is refreshed."
-    )
-    gpu_parent.setIcon(0, app.style().standardIcon(QStyle.SP_MessageBoxInformation))
-
 gpu_temp_item = QTreeWidgetItem(gpu_parent, ["GPU Temp"])
 gpu_hot_item = QTreeWidgetItem(gpu_parent, ["GPU Hotspot"])
 gpu_mem_item = QTreeWidgetItem(gpu_parent, ["GPU Memory"])
@@ -242,6 +600,14 @@ gpu_clk_item = QTreeWidgetItem(gpu_parent, ["GPU Core Clock (MHz)"])
 gpu_memclk_item = QTreeWidgetItem(gpu_parent, ["GPU Memory Clock (MHz)"])
 gpu_fan_item = QTreeWidgetItem(gpu_parent, ["GPU Fan Speed (RPM)"])
 
+# hwmon label -> (tree item, stats row) for the GPU temp sensors; they
+# all follow the same update pattern.
+GPU_TEMP_SENSORS = [
+    ("edge", gpu_temp_item, "gpu_temp"),
+    ("junction", gpu_hot_item, "gpu_hot"),
+    ("mem", gpu_mem_item, "gpu_mem"),
+]
+
 # -------------------------------------------------
 # Storage
 # -------------------------------------------------
@@ -250,124 +616,118 @@ storage_parent.setExpanded(True)
 
 nvme_item = QTreeWidgetItem(storage_parent, ["NVMe Composite"])
 nvme_item.setText(4, "—")
-nvme_item.setForeground(4, QColor("gray"))
+nvme_item.setForeground(4, _GRAY)
 nvme_item.setToolTip(4, "Critical temperature not exposed by kernel")
 
 # -------------------------------------------------
-# Update loop
+# Update loop (GUI thread: paint only, no sysfs I/O)
 # -------------------------------------------------
-def update():
-    global cpu_pkg_min, cpu_pkg_max, cpu_die_min, cpu_die_max
-    global cpu_clk_min, cpu_clk_max
-    global gpu_temp_min, gpu_temp_max, gpu_hot_min, gpu_hot_max, gpu_mem_min, gpu_mem_max
-    global gpu_clk_min, gpu_clk_max, gpu_memclk_min, gpu_memclk_max, gpu_fan_min, gpu_fan_max
-    global nvme_min, nvme_max
-
-    cpu = read_hwmon(CPU_HWMON)
+def apply_snapshot(snap):
+    cpu = snap["cpu"]
 
     if "Tctl" in cpu:
         t, _ = cpu["Tctl"]
-        cpu_pkg_min = t if cpu_pkg_min is None else min(cpu_pkg_min, t)
-        cpu_pkg_max = t if cpu_pkg_max is None else max(cpu_pkg_max, t)
-        cpu_pkg_item.setText(1, f"{t:.1f}")
-        cpu_pkg_item.setText(2, f"{cpu_pkg_min:.1f}")
-        cpu_pkg_item.setText(3, f"{cpu_pkg_max:.1f}")
+        cur_s, lo_s, hi_s = update_stat("cpu_pkg", t, ".1f")
+        set_if_changed(cpu_pkg_item, 1, cur_s)
+        set_if_changed(cpu_pkg_item, 2, lo_s)
+        set_if_changed(cpu_pkg_item, 3, hi_s)
         set_temp_colour(cpu_pkg_item, 1, t)
 
     if "Tccd1" in cpu:
         t, _ = cpu["Tccd1"]
-        cpu_die_min = t if cpu_die_min is None else min(cpu_die_min, t)
-        cpu_die_max = t if cpu_die_max is None else max(cpu_die_max, t)
-        cpu_die_item.setText(1, f"{t:.1f}")
-        cpu_die_item.setText(2, f"{cpu_die_min:.1f}")
-        cpu_die_item.setText(3, f"{cpu_die_max:.1f}")
+        cur_s, lo_s, hi_s = update_stat("cpu_die", t, ".1f")
+        set_if_changed(cpu_die_item, 1, cur_s)
+        set_if_changed(cpu_die_item, 2, lo_s)
+        set_if_changed(cpu_die_item, 3, hi_s)
         set_temp_colour(cpu_die_item, 1, t)
 
-    clk = read_cpu_clock()
+    clk = snap["cpu_clk"]
     if clk:
-        cpu_clk_min = clk if cpu_clk_min is None else min(cpu_clk_min, clk)
-        cpu_clk_max = clk if cpu_clk_max is None else max(cpu_clk_max, clk)
-        cpu_clk_item.setText(1, f"{clk:.2f}")
-        cpu_clk_item.setText(2, f"{cpu_clk_min:.2f}")
-        cpu_clk_item.setText(3, f"{cpu_clk_max:.2f}")
-
-    for path in GPU_HWMONS:
-        gpu = read_hwmon(path)
-
-        if "edge" in gpu:
-            t, c = gpu["edge"]
-            gpu_temp_min = t if gpu_temp_min is None else min(gpu_temp_min, t)
-            gpu_temp_max = t if gpu_temp_max is None else max(gpu_temp_max, t)
-            gpu_temp_item.setText(1, f"{t:.1f}")
-            gpu_temp_item.setText(2, f"{gpu_temp_min:.1f}")
-            gpu_temp_item.setText(3, f"{gpu_temp_max:.1f}")
-            if c:
-                gpu_temp_item.setText(4, f"{c:.0f}")
-                gpu_temp_item.setForeground(4, QColor("#c0392b"))
-
-        if "junction" in gpu:
-            t, c = gpu["junction"]
-            gpu_hot_min = t if gpu_hot_min is None else min(gpu_hot_min, t)
-            gpu_hot_max = t if gpu_hot_max is None else max(gpu_hot_max, t)
-            gpu_hot_item.setText(1, f"{t:.1f}")
-            gpu_hot_item.setText(2, f"{gpu_hot_min:.1f}")
-            gpu_hot_item.setText(3, f"{gpu_hot_max:.1f}")
-            if c:
-                gpu_hot_item.setText(4, f"{c:.0f}")
-                gpu_hot_item.setForeground(4, QColor("#c0392b"))
-
-        if "mem" in gpu:
-            t, c = gpu["mem"]
-            gpu_mem_min = t if gpu_mem_min is None else min(gpu_mem_min, t)
-            gpu_mem_max = t if gpu_mem_max is None else max(gpu_mem_max, t)
-            gpu_mem_item.setText(1, f"{t:.1f}")
-            gpu_mem_item.setText(2, f"{gpu_mem_min:.1f}")
-            gpu_mem_item.setText(3, f"{gpu_mem_max:.1f}")
-            if c:
-                gpu_mem_item.setText(4, f"{c:.0f}")
-                gpu_mem_item.setForeground(4, QColor("#c0392b"))
+        cur_s, lo_s, hi_s = update_stat("cpu_clk", clk, ".2f")
+        set_if_changed(cpu_clk_item, 1, cur_s)
+        set_if_changed(cpu_clk_item, 2, lo_s)
+        set_if_changed(cpu_clk_item, 3, hi_s)
 
-    gclk, gmemclk, gfan = read_gpu_clocks_and_fan()
+    gpu = snap["gpu"]
+
+    for sensor, item, stat_key in GPU_TEMP_SENSORS:
+        if sensor not in gpu:
+            continue
+        t, c = gpu[sensor]
+        cur_s, lo_s, hi_s = update_stat(stat_key, t, ".1f")
+        set_if_changed(item, 1, cur_s)
+        set_if_changed(item, 2, lo_s)
+        set_if_changed(item, 3, hi_s)
+        if c and set_if_changed(item, 4, f"{c:.0f}"):
+            item.setForeground(4, _RED)
+
+    gclk = snap["gpu_clk"]
+    gmemclk = snap["gpu_memclk"]
+    gfan = snap["gpu_fan"]
 
     if gclk:
-        gpu_clk_min = gclk if gpu_clk_min is None else min(gpu_clk_min, gclk)
-        gpu_clk_max = gclk if gpu_clk_max is None else max(gpu_clk_max, gclk)
-        gpu_clk_item.setText(1, f"{gclk:.0f}")
-        gpu_clk_item.setText(2, f"{gpu_clk_min:.0f}")
-        gpu_clk_item.setText(3, f"{gpu_clk_max:.0f}")
+        cur_s, lo_s, hi_s = update_stat("gpu_clk", gclk, ".0f")
+        set_if_changed(gpu_clk_item, 1, cur_s)
+        set_if_changed(gpu_clk_item, 2, lo_s)
+        set_if_changed(gpu_clk_item, 3, hi_s)
 
     if gmemclk:
-        gpu_memclk_min = gmemclk if gpu_memclk_min is None else min(gpu_memclk_min, gmemclk)
-        gpu_memclk_max = gmemclk if gpu_memclk_max is None else max(gpu_memclk_max, gmemclk)
-        gpu_memclk_item.setText(1, f"{gmemclk:.0f}")
-        gpu_memclk_item.setText(2, f"{gpu_memclk_min:.0f}")
-        gpu_memclk_item.setText(3, f"{gpu_memclk_max:.0f}")
+        cur_s, lo_s, hi_s = update_stat("gpu_memclk", gmemclk, ".0f")
+        set_if_changed(gpu_memclk_item, 1, cur_s)
+        set_if_changed(gpu_memclk_item, 2, lo_s)
+        set_if_changed(gpu_memclk_item, 3, hi_s)
 
     if gfan is not None:
-        gpu_fan_min = gfan if gpu_fan_min is None else min(gpu_fan_min, gfan)
-        gpu_fan_max = gfan if gpu_fan_max is None else max(gpu_fan_max, gfan)
-        gpu_fan_item.setText(1, f"{gfan}")
-        gpu_fan_item.setText(2, f"{gpu_fan_min}")
-        gpu_fan_item.setText(3, f"{gpu_fan_max}")
-
-    nvme = read_hwmon(NVME_HWMON)
-    if nvme:
-        _, (t, _) = next(iter(nvme.items()))
-        nvme_min = t if nvme_min is None else min(nvme_min, t)
-        nvme_max = t if nvme_max is None else max(nvme_max, t)
-        nvme_item.setText(1, f"{t:.1f}")
-        nvme_item.setText(2, f"{nvme_min:.1f}")
-        nvme_item.setText(3, f"{nvme_max:.1f}")
-
-timer = QTimer()
-timer.timeout.connect(update)
-timer.start(1000)
+        cur_s, lo_s, hi_s = update_stat("gpu_fan", gfan, "")
+        set_if_changed(gpu_fan_item, 1, cur_s)
+        set_if_changed(gpu_fan_item, 2, lo_s)
+        set_if_changed(gpu_fan_item, 3, hi_s)
+
+    t = snap["nvme"]
+    if t is not None:
+        cur_s, lo_s, hi_s = update_stat("nvme", t, ".1f")
+        set_if_changed(nvme_item, 1, cur_s)
+        set_if_changed(nvme_item, 2, lo_s)
+        set_if_changed(nvme_item, 3, hi_s)
+
+poller = SensorPoller()
+poller.updated.connect(apply_snapshot)
+poller.start()
+
+def stop_poller():
+    poller.requestInterruption()
+    poller.wait()
+
+app.aboutToQuit.connect(stop_poller)
+
+_main_shown = False
 
 def show_main():
+    global _main_shown
+    if _main_shown:
+        return
+    _main_shown = True
     window.show()
     splash.finish(window)
-    update()
 
-QTimer.singleShot(SPLASH_MIN_MS, show_main)
+def apply_names(cpu_name, gpu_name, gpu_known):
+    cpu_parent.setText(0, f"CPU ({cpu_name})")
+    gpu_parent.setText(0, f"GPU ({gpu_name})")
+
+    if not gpu_known:
+        gpu_parent.setToolTip(
+            0,
+            "GPU model name not yet available in the system PCI database.\n"
+            "This will update automatically when pci.ids is refreshed."
+        )
+        gpu_parent.setIcon(0, app.style().standardIcon(QStyle.SP_MessageBoxInformation))
+
+    show_main()
+
+name_worker = NameWorker()
+name_worker.signals.finished.connect(apply_names)
+QThreadPool.globalInstance().start(name_worker)
+
+QTimer.singleShot(SPLASH_MAX_MS, show_main)
 
 sys.exit(app.exec())